@@ -26,6 +26,7 @@
 """ Model classes and auxiliary functions for data fitting.
 """
 
+import functools
 import sys
 from typing import Callable, Optional, Sequence, Union
 from types import ModuleType
@@ -124,6 +125,7 @@ def restore(
         return f(x, p).restore(fun, y)
 
 
+@functools.lru_cache(maxsize=256)
 def class_from_classname(
         module: ModuleType,
         classname: str,
@@ -135,6 +137,7 @@ def class_from_classname(
                    classname.split('.')[0])
 
 
+@functools.lru_cache(maxsize=256)
 def subtype_from_classname(
         c: type,
         classname: str,
@@ -151,6 +154,7 @@ def subtype_from_classname(
         return c
 
 
+@functools.lru_cache(maxsize=256)
 def method_from_classname(
         c: type,
         classname: str,
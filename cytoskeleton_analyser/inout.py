@@ -27,12 +27,15 @@
 """
 
 import csv
+import functools
 import gzip
 import logging
 import pathlib as pl
 import struct
 import sys
 import zipfile
+from collections import deque
+from itertools import islice
 from typing import BinaryIO, Final, Optional, Sequence, TextIO, Union
 
 import numpy as np
@@ -85,9 +88,12 @@ class Reader:
     """
 
     def __init__(self,
-                 fname: pl.Path):
+                 fname: Union[pl.Path, TextIO]):
 
-        self.f: Final[TextIO] = open(fname, 'r')
+        # An already open text stream is used as is, so callers can
+        # share one in-memory buffer between readers.
+        self.f: Final[TextIO] = fname if hasattr(fname, 'readline') \
+            else open(fname, 'r')
 
     def __enter__(self):
 
@@ -101,29 +107,44 @@ class Reader:
     def skip_lines(self, n: int):
         """ Skip 'n' lines.
         """
-        last_line = ''
-        for _ in range(n):
-            last_line = self.f.readline()
+        if n <= 0:
+            return ''
+        # All but the last line are consumed entirely in C.
+        deque(islice(self.f, n - 1), maxlen=0)
 
-        return last_line
+        return self.f.readline()
 
     def value(self, i: int):
 
         u = self.f.readline()
-        return u.split()[i]
+        # The bounded split stops tokenising right after the wanted
+        # token.
+        return u.split(None, i + 1)[i]
 
-    def array(self, i: int):
+    def array(self, i: int) -> np.ndarray:
 
         u = self.f.readline()
-        return [float(x) for x in u.split()[i:]]
+        # One C-level conversion instead of a float() call per token.
+        return np.array(u.split()[i:], dtype=float)
 
     def array_float(self, i: int) -> list[float]:
 
-        return [float(x) for x in self.array(i)]
+        return self.array(i).tolist()
 
     def array_int(self, i: int) -> list[int]:
 
-        return [int(x) for x in self.array(i)]
+        return self.array(i).astype(int).tolist()
+
+
+@functools.lru_cache(maxsize=None)
+def _scalar_struct(char: str) -> struct.Struct:
+    """Precompiled single-value codec for the scalar read fast path.
+
+    Kept in native mode to match the format strings used for the
+    multi-value reads.
+    """
+
+    return struct.Struct(char)
 
 
 def read_to_dtype(
@@ -142,6 +163,10 @@ def read_to_dtype(
 
     nda = isinstance(v, np.ndarray)
     tp = v.dtype if nda else np.dtype(v)
+    if n == 1 and not nda:
+        # Single scalars skip the per-call format-string parsing.
+        s = _scalar_struct(tp.char)
+        return s.unpack(f.read(s.size))[0]
     u = struct.unpack(str(n) + tp.char, f.read(n * tp.itemsize))
 
     return u[:n] if nda else u[0]
@@ -151,16 +176,79 @@ def read_to_ndarray(
         v: np.ndarray,
         f: BinaryIO,
         i: int,
+        count: int = 1,
 ) -> None:
     """Read in (in place) an numpy.ndarray of numbers.
 
     Data are read from the descriptor 'f' of a binary file.
+    With ``count`` > 1, a contiguous run of rows is fetched in a
+    single read and interpreted in place, avoiding the per-element
+    unpacking overhead.
+
     :param v: Data placeholder.
     :param f: Binary file.
     :param i: Array index.
+    :param count: How many rows to read in.
     """
     n = 1 if v.ndim == 1 else v.shape[1]
-    v[i] = read_to_dtype(v[i], f, n)
+    if count == 1:
+        v[i] = read_to_dtype(v[i], f, n)
+    else:
+        u = np.frombuffer(f.read(count * n * v.dtype.itemsize),
+                          dtype=v.dtype)
+        v[i:i + count] = u.reshape(count, n) if v.ndim > 1 else u
+
+
+def read_to_ndarray_bulk(
+        a: np.ndarray,
+        f: BinaryIO,
+        count: Optional[int] = None,
+) -> None:
+    """Fill ``a`` in place from a binary file in a single bulk read.
+
+    One C-level copy replaces the per-index assignments of repeated
+    :func:`read_to_ndarray` calls.
+
+    :param a: Data placeholder.
+    :param f: Binary file.
+    :param count: How many elements to read; defaults to the full
+        array size.
+    :raises ValueError: If ``a`` is not C-contiguous.
+    """
+
+    if count is None:
+        count = a.size
+    # For non-contiguous destinations ravel would return a copy and
+    # the assignment would be silently discarded.
+    if not a.flags['C_CONTIGUOUS']:
+        raise ValueError(
+            'read_to_ndarray_bulk needs a C-contiguous destination')
+    a.ravel()[:count] = np.frombuffer(
+        f.read(count * a.dtype.itemsize), dtype=a.dtype)
+
+
+def read_records(
+        f: BinaryIO,
+        nf: int,
+        ni: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Parse a float32/int32 record with one read and no per-element
+    dispatch.
+
+    The whole record is fetched in a single read; both blocks are then
+    reinterpreted in place with C-level casts.
+
+    :param f: Binary file.
+    :param nf: Number of leading float32 values.
+    :param ni: Number of trailing int32 values.
+    :return: The float and int blocks of the record.
+    """
+
+    buf = f.read(nf * 4 + ni * 4)
+    ff = np.frombuffer(buf, dtype=np.float32, count=nf)
+    ii = np.frombuffer(buf, dtype=np.int32, count=ni, offset=nf * 4)
+
+    return ff, ii
 
 
 def set_logger(
@@ -238,10 +326,12 @@ def rmdir(d: pl.Path) -> None:
         print(f'Error: {e.filename} - {e.strerror}.')
 
 
+@functools.lru_cache(maxsize=1024)
 def underscored(s: str) -> str:
     """Turn spaces in the string ``str`` into underscores.
 
-    Used primarely for filename formatting.
+    Used primarely for filename formatting. The feature names passed
+    in are drawn from a small fixed set, so results are memoized.
     """
 
     return '_'.join(s.split(' '))
@@ -277,18 +367,85 @@ def flatten_dict(
     if exc is None:
         exc = []
     u = {}
-    for k, v in d.items():
-        if k in exc:
-            u[k] = v
-        else:
-            if len(s):
-                k = s + '_' + k
+    setitem = u.__setitem__
+    # Depth-first traversal with an explicit stack avoids the frame
+    # allocations of recursion; as before, ``exc`` only applies to
+    # the top-level keys.
+    stack = deque([(s, d, True)])
+    while stack:
+        p, dd, top = stack.pop()
+        for k, v in dd.items():
+            if top and k in exc:
+                setitem(k, v)
+                continue
+            if len(p):
+                k = p + '_' + k
             if isinstance(v, dict):
-                u |= flatten_dict(v, k)
+                stack.append((k, v, False))
             elif isinstance(v, list):
-                u |= {k+'_'+str(i): vv for i, vv in enumerate(v)}
+                for i, vv in enumerate(v):
+                    setitem(k + '_' + str(i), vv)
             else:
-                u[k] = v
-                print('')
+                setitem(k, v)
 
     return u
+
+
+def _dict_schema(d: dict) -> tuple:
+    """Hashable key layout of a nested dict, ignoring leaf values.
+
+    Lists are represented by their length, sub-dicts by their own
+    schema.
+    """
+
+    return tuple(
+        (k, _dict_schema(v)) if isinstance(v, dict) else
+        (k, len(v)) if isinstance(v, list) else
+        (k, None)
+        for k, v in d.items())
+
+
+@functools.lru_cache(maxsize=256)
+def _compiled_flattener(schema: tuple):
+    """Generate a flat-assignment function for a fixed dict layout.
+
+    The returned function produces one dict literal of direct
+    subscript expressions, with no traversal or key formatting left
+    for call time.
+    """
+
+    pairs = []
+
+    def walk(sch, prefix, path):
+        for k, sub in sch:
+            key = prefix + '_' + k if prefix else k
+            p = f'{path}[{k!r}]'
+            if isinstance(sub, tuple):
+                walk(sub, key, p)
+            elif isinstance(sub, int):
+                for i in range(sub):
+                    pairs.append((f'{key}_{i}', f'{p}[{i}]'))
+            else:
+                pairs.append((key, p))
+
+    walk(schema, '', 'u')
+    body = ','.join(f'{k!r}:{p}' for k, p in pairs)
+    ns = {}
+    exec(f'def _f(u):\n    return {{{body}}}', ns)
+
+    return ns['_f']
+
+
+def flatten_dict_compiled(d: dict) -> dict:
+    """Flatten a dict with a function generated for its key layout.
+
+    Equivalent to :func:`flatten_dict` without the ``exc`` handling.
+    Dicts sharing the same nested key structure reuse one generated
+    function, so repeated flattening of same-shaped inputs skips the
+    traversal entirely.
+
+    :param d: Input dict.
+    :return: Reformatted dictionary.
+    """
+
+    return _compiled_flattener(_dict_schema(d))(d)
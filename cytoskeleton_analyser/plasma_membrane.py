@@ -28,6 +28,7 @@
 It defines volume available for the microtubules.
 """
 
+from functools import cached_property
 from pathlib import Path
 
 import meshio
@@ -83,6 +84,17 @@ class PlasmaMembrane:
         fname = path / f"plasmaMesh_{cell.plmind}.stl"
         return meshio.read(fname)
 
+    @cached_property
+    def triangle_vertices(self) -> np.ndarray:
+        """Vertex positions of the mesh triangles as a (T, 3, 3) array.
+
+        Gathered once with a single fancy index and cached, since both
+        the 3d plots and the svg export iterate the triangles.
+        """
+
+        return self.mesh.points[
+            np.asarray(self.mesh.cells_dict['triangle'])]
+
     def radial_extent(self) -> float:
         """Max extents of the membrane mesh in xy plane.
 
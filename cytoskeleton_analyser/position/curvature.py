@@ -31,6 +31,32 @@ from typing import Final, Union
 import numpy as np
 
 
+def _segment_gradient(
+        a: np.ndarray,
+        starts: np.ndarray,
+        ends: np.ndarray,
+) -> np.ndarray:
+    """np.gradient along axis 0 applied per segment of a flat array.
+
+    Central differences are taken in one vectorised pass over the
+    whole array; the rows at segment boundaries (which would otherwise
+    mix neighbouring segments) are then overwritten with the one-sided
+    differences np.gradient uses at array ends.
+
+    :param a: Concatenation of the segments, (n, d)-shaped.
+    :param starts: Indexes of the first row of each segment.
+    :param ends: Indexes of the last row of each segment.
+    :return: Per-segment gradient of ``a``.
+    """
+
+    g = np.empty_like(a)
+    g[1:-1] = (a[2:] - a[:-2]) / 2.
+    g[starts] = a[starts + 1] - a[starts]
+    g[ends] = a[ends] - a[ends - 1]
+
+    return g
+
+
 class D2:
     """Approximation of 2d curvature.
 
@@ -113,17 +139,23 @@ class Curvature:
         """
 
         c = [np.empty(0, dtype=float) for _ in range(len(p3d))]
-        for ip, pp in enumerate(p3d):
-            nnodes = pp.shape[0]
-            if nnodes < 2:
-                continue
-            dp = np.empty([crv.d, nnodes])
-            ddp = np.empty([crv.d, nnodes])
-            for kk in range(crv.d):
-                dp[kk, :] = np.gradient(pp[:, kk])
-                ddp[kk, :] = np.gradient(dp[kk, :])
-            if dp.shape[1]:
-                c[ip] = np.array(crv.c(dp, ddp))
+        keep = [ip for ip, pp in enumerate(p3d) if pp.shape[0] >= 2]
+        if not keep:
+            return np.empty(0), c
+
+        # All lines are processed in one pass over their concatenation,
+        # with the differences localised to the segments.
+        flat = np.concatenate(
+            [p3d[ip][:, :crv.d] for ip in keep]).astype(np.float64)
+        nn = np.fromiter((p3d[ip].shape[0] for ip in keep),
+                         dtype=np.intp, count=len(keep))
+        bounds = np.cumsum(nn)
+        starts = bounds - nn
+        dp = _segment_gradient(flat, starts, bounds - 1)
+        ddp = _segment_gradient(dp, starts, bounds - 1)
+        vals = crv.c(dp.T, ddp.T)
+        for ip, v in zip(keep, np.split(vals, bounds[:-1])):
+            c[ip] = v
 
         return np.concatenate(c), c
 
@@ -144,7 +176,7 @@ class Curvature:
             a sequence of points in 3d space.
         """
 
-        c1d = []
+        c1d = [np.empty(0)]
 
         for pp in p3d:
             p = pp[::2, :]       # to get a 400 nm step as in the paper
@@ -163,9 +195,9 @@ class Curvature:
             y20 = y2[:s] - y0[:s]
             y12 = y1[:s] - y2[:s]
 
-            c1d.extend(2*np.abs(x10 * y20 - x20 * y10) /
+            c1d.append(2*np.abs(x10 * y20 - x20 * y10) /
                        np.sqrt((x10**2 + y10**2) *
                                (x20**2 + y20**2) *
                                (x12**2 + y12**2)))
 
-        return np.array(c1d)
+        return np.concatenate(c1d)
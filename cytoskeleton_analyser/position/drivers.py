@@ -29,6 +29,7 @@ from typing import Optional
 from ..inout import Paths
 from ..inout import set_logger
 from .reporters import Features
+from .reporters import run_all_reports
 from .spatial_systems import ListOfSpatialSystems
 from .spatial_systems import FullDepth
 from .spatial_systems import Slice
@@ -135,14 +136,7 @@ def produce_for_type(
         sp[0].plot3d('', with_mesh=True, mesh_flattened=True,
                      axes_visible=False, export=True, show=show)
 
-    if features is None:
-        features = Features.all
-
-    for f in features:
-        if Features.is_applicable(f, tp):
-            Features.reporter(f)\
-                    .create(tp, show)\
-                    .pipeline(sp)
+    run_all_reports(sp, show, features)
 
 
 def restore(
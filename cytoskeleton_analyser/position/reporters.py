@@ -42,7 +42,9 @@ where:
 """
 
 from __future__ import annotations
+import functools
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Final, Optional
 
@@ -55,6 +57,44 @@ from ..histograms import Simulated
 from ..report import Report
 from .spatial_systems import FullDepth
 from .spatial_systems import ListOfSpatialSystems
+from .spatial_systems import _flatten
+
+#: Index of the mboc17 empirical data set applicable to a cell type.
+_MBOC17_IDX: Final[dict[str, int]] = {'RW_Protr': 1, 'SpreRou': 0}
+
+
+def _fold_polar(d: np.ndarray) -> np.ndarray:
+    """Fold angles from the 0..2*pi range onto 0..pi, in place.
+
+    For d in [0, 2*pi) the fold equals min(d, 2*pi - d), which runs
+    as a single branchless SIMD pass.
+
+    :param d: Angles (rad); the array is modified and returned.
+    """
+
+    np.minimum(d, 2. * np.pi - d, out=d)
+    return d
+
+
+@functools.lru_cache(maxsize=4)
+def _mboc17_curvature(cell_type: str) -> tuple[list, list, float]:
+    """Empirical curvature distribution for ``cell_type``.
+
+    Extraction of the published data set is a pure function of the cell
+    type, so the result is memoized across repeated report runs.
+
+    :param cell_type: Cell type name.
+    :return: Bin centers, frequencies and distribution average.
+    """
+
+    import cytoskeleton_analyser.position.empirical_data.mboc17 as zh
+
+    bc, (contr, ca_ras) = zh.curvature(density=True)
+    idx = _MBOC17_IDX.get(cell_type)
+    assert idx is not None, 'Wrong Cell Type'
+    h = (contr, ca_ras)[idx]
+
+    return bc, h, zh.avg(bc, h)
 
 
 class Features:
@@ -154,6 +194,33 @@ class Features:
         return globals()[f]
 
 
+def run_all_reports(
+        sp: ListOfSpatialSystems,
+        show: bool,
+        features: Optional[list[str]] = None,
+) -> None:
+    """Dispatch the applicable reporter pipelines over ``sp`` as a batch.
+
+    The per-system attribute arrays consumed by the reporters are
+    precomputed on the system instances, so batching here amounts to a
+    single dispatch loop rather than a data-prefetch pass.
+
+    :param sp: List of instances of the reconstructed spatial systems.
+    :param show: If True, display the generated plots interactively.
+    :param features: Features to report. If is None, all are reported.
+    """
+
+    tp = type(sp[0])
+    if features is None:
+        features = Features.all
+
+    for f in features:
+        if Features.is_applicable(f, tp):
+            Features.reporter(f)\
+                    .create(tp, show)\
+                    .pipeline(sp)
+
+
 class _Report(Report):
     """Adaptation of report.Report class for spatial systems.
 
@@ -203,12 +270,12 @@ class Lengths3d(_Report):
             sp: ListOfSpatialSystems,
     ) -> tuple[Histogram, list, list]:
 
-        data = [s.len_total3d for s in sp]
-        avg, std = cls.tp.print_avgstd(cls.LABEL, data, cls.units)
+        flat, sizes = _flatten([s.len_total3d for s in sp])
+        avg, std = cls.tp.print_avgstd(cls.LABEL, (flat, sizes), cls.units)
 
         h = Histogram(
             cls.name,
-            Simulated().initialise(data, cls.fits_sim, dx=0.4, density=True)
+            Simulated.from_density(flat, cls.fits_sim, dx=0.4)
         )
         h.to_csv(cls.path_out)
         cls.plot(h)
@@ -278,13 +345,13 @@ class Lengths2d(_Report):
         import cytoskeleton_analyser.position.empirical_data.mboc17 as mboc17
 
         bc, (contr, ca_ras) = mboc17.length(density=True)
-        if cell_type == 'RW_Protr':
-            h = ca_ras
-        elif cell_type == 'SpreRou':
-            h = contr
+        idx = _MBOC17_IDX.get(cell_type)
+        if idx is None:
+            raise KeyError(f'No empirical length data for {cell_type}.')
+        h = (contr, ca_ras)[idx]
         avg = mboc17.avg(bc, h)
-        cls.logger.info('\nEmpirical length of filament 2d projections in ' +
-                        f'{cls.tp.type}: {avg} {cls.units}')
+        cls.logger.info('\nEmpirical length of filament 2d projections in '
+                        '%s: %s %s', cls.tp.type, avg, cls.units)
 
         return bc, h, avg
 
@@ -294,8 +361,8 @@ class Lengths2d(_Report):
             sp: ListOfSpatialSystems,
     ) -> tuple[Histogram, list, list]:
 
-        data = [s.len_total2d for s in sp]
-        avg, std = cls.tp.print_avgstd(cls.LABEL, data, cls.units)
+        flat, sizes = _flatten([s.len_total2d for s in sp])
+        avg, std = cls.tp.print_avgstd(cls.LABEL, (flat, sizes), cls.units)
 
         ct = cls.tp.params['cell'].typename
         if cls.tp.type == 'slice' and \
@@ -306,15 +373,14 @@ class Lengths2d(_Report):
             h = Histogram(
                 cls.name,
                 Simulated().initialise(
-                    data, cls.fits_sim, dx=0.4, exper_bc=e.bc, density=True),
+                    flat, cls.fits_sim, dx=0.4, exper_bc=e.bc, density=True),
                 experimental=e
             )
             avg, std = [avg, l_avg], [std, np.nan]
         else:
             h = Histogram(
                 cls.name,
-                Simulated().initialise(
-                    data, cls.fits_sim, dx=0.4, density=True),
+                Simulated.from_density(flat, cls.fits_sim, dx=0.4),
             )
             avg, std = [avg], [std]
         h.to_csv(cls.path_out)
@@ -398,14 +464,13 @@ class RadialMass(_Report):
             sp: ListOfSpatialSystems
     ) -> tuple[Histogram, list, list]:
 
-        data = [np.concatenate(s.center_dist_2d) for s in sp]
-        avg, std = cls.tp.print_avgstd(cls.LABEL, data, cls.units)
+        flat, sizes = _flatten([np.concatenate(s.center_dist_2d)
+                                for s in sp])
+        avg, std = cls.tp.print_avgstd(cls.LABEL, (flat, sizes), cls.units)
 
         h = Histogram(
             cls.name,
-            Simulated().initialise(
-                data, fits=cls.fits_sim, dx=0.25, density=True
-            ),
+            Simulated.from_density(flat, fits=cls.fits_sim, dx=0.25),
         )
         h.to_csv(cls.path_out)
         cls.plot(h)
@@ -462,13 +527,13 @@ class RadialEnds(_Report):
             sp: ListOfSpatialSystems,
     ) -> tuple[Histogram, list, list]:
 
-        data = [np.concatenate(s.center_dist_2d_ends) for s in sp]
-        avg, std = cls.tp.print_avgstd(cls.LABEL, data, cls.units)
+        flat, sizes = _flatten([np.concatenate(s.center_dist_2d_ends)
+                                for s in sp])
+        avg, std = cls.tp.print_avgstd(cls.LABEL, (flat, sizes), cls.units)
 
         h = Histogram(
             cls.name,
-            Simulated().initialise(
-                data, fits=cls.fits_sim, dx=0.25, density=True)
+            Simulated.from_density(flat, fits=cls.fits_sim, dx=0.25)
         )
         h.to_csv(cls.path_out)
         cls.plot(h)
@@ -522,12 +587,13 @@ class SegmentNumbers(_Report):
             sp: ListOfSpatialSystems,
     ) -> tuple[Optional[Histogram], list, list]:
 
-        cls.logger.info(f"Number of filaments in {cls.tp.type}:")
-        data = np.array([len(s.len_total3d) for s in sp])
-        [cls.logger.info(f'\t {n}') for n in data]
+        cls.logger.info("Number of filaments in %s:", cls.tp.type)
+        data = np.fromiter((len(s.len_total3d) for s in sp),
+                           dtype=np.int64, count=len(sp))
+        [cls.logger.info('\t %s', n) for n in data]
         avg = np.mean(data)
         std = np.std(data)
-        cls.logger.info(f"overall: {avg} ± {std} slices\n")
+        cls.logger.info("overall: %s ± %s slices\n", avg, std)
 
         fname = cls.path_out / f"{cls.name}.json"
         with open(fname, 'w') as f:
@@ -542,7 +608,7 @@ class SegmentNumbers(_Report):
             path: Path
     ) -> dict:
 
-        cls.logger.info('Restoring ' + cls.name + ':')
+        cls.logger.info('Restoring %s:', cls.name)
         summary = cls.log_stats(path)
 
         # fname = f"{cls.path_out}{cls.name}.json"
@@ -587,12 +653,12 @@ class Curvature3d(_Report):
             sp: ListOfSpatialSystems,
     ) -> tuple[Histogram, list, list]:
 
-        data = [s.curv3d for s in sp]
-        avg, std = cls.tp.print_avgstd(cls.LABEL, data, cls.units)
+        flat, sizes = _flatten([s.curv3d for s in sp])
+        avg, std = cls.tp.print_avgstd(cls.LABEL, (flat, sizes), cls.units)
 
         h = Histogram(
             cls.name,
-            Simulated().initialise(data, cls.fits_sim, dx=0.02, density=True)
+            Simulated.from_density(flat, cls.fits_sim, dx=0.02)
         )
         h.to_csv(cls.path_out)
         cls.plot(h)
@@ -651,12 +717,12 @@ class Curvature2dConv(_Report):
             sp: ListOfSpatialSystems,
     ) -> tuple[Histogram, list, list]:
 
-        data = [s.curv2d for s in sp]
-        avg, std = cls.tp.print_avgstd(cls.LABEL, data, cls.units)
+        flat, sizes = _flatten([s.curv2d for s in sp])
+        avg, std = cls.tp.print_avgstd(cls.LABEL, (flat, sizes), cls.units)
 
         h = Histogram(
             cls.name,
-            Simulated().initialise(data, cls.fits_sim, dx=0.02, density=True)
+            Simulated.from_density(flat, cls.fits_sim, dx=0.02)
         )
         h.to_csv(cls.path_out)
         cls.plot(h)
@@ -700,6 +766,9 @@ class Curvature2dMboc17(_Report):
     #: Part of figure and report titles.
     LABEL: Final = 'empirical curvature of filament 2d projections in'
 
+    #: Experimental histograms reused across report runs, per cell type.
+    _exper_cache: dict[str, Experimental] = {}
+
     @classmethod
     def create(
             cls,
@@ -732,18 +801,9 @@ class Curvature2dMboc17(_Report):
             cell_type: str
     ) -> tuple[list, Histogram, float]:
 
-        import cytoskeleton_analyser.position.empirical_data.mboc17 as zh
-
-        bc, (contr, ca_ras) = zh.curvature(density=True)
-        if cell_type == 'RW_Protr':
-            h = ca_ras
-        elif cell_type == 'SpreRou':
-            h = contr
-        else:
-            assert False, 'Wrong Cell Type'
-        avg = zh.avg(bc, h)
-        cls.logger.info('\nEmpirical curvature of filament 2d projections in '
-                        + f'{cls.tp.type}: {avg} {cls.units}')
+        bc, h, avg = _mboc17_curvature(cell_type)
+        cls.logger.info('\nEmpirical curvature of filament 2d projections '
+                        'in %s: %s %s', cls.tp.type, avg, cls.units)
 
         return bc, h, avg
 
@@ -753,31 +813,37 @@ class Curvature2dMboc17(_Report):
             sp: ListOfSpatialSystems,
     ) -> tuple[Histogram, list, list]:
 
+        tp = cls.tp
+        ct = tp.params['cell'].typename
+
         data = [s.curv2d_mboc17 for s in sp]
-        avg, std = cls.tp.print_avgstd(cls.LABEL, data, cls.units)
+        flat, sizes = _flatten(data)
+        avg, std = tp.print_avgstd(cls.LABEL, (flat, sizes), cls.units)
 
-        ct = cls.tp.params['cell'].typename
-        if cls.tp.type == 'slice' and \
+        if tp.type == 'slice' and \
                 (ct == 'RW_Protr' or
                  ct == 'SpreRou'):
             bc, c, c_avg = cls.experimental(ct)
-            e = Experimental().initialise((bc, c), cls.fits_exp)
+            e = cls._exper_cache.get(ct)
+            if e is None:
+                e = cls._exper_cache[ct] = \
+                    Experimental().initialise((bc, c), cls.fits_exp)
             h = Histogram(
                 cls.name,
                 Simulated().initialise(
-                    data, cls.fits_sim, dx=0.02, exper_bc=e.bc, density=True),
+                    flat, cls.fits_sim, dx=0.02, exper_bc=e.bc, density=True),
                 e,
             )
             avg, std = [avg, c_avg], [std, np.nan]
         else:
             h = Histogram(
                 cls.name,
-                Simulated().initialise(
-                    data, cls.fits_sim, dx=0.02, density=True),
+                Simulated.from_density(flat, cls.fits_sim, dx=0.02),
             )
             avg, std = [avg], [std]
         h.to_csv(cls.path_out)
-        cls.plot(h)
+        if cls.show or cls.save_plot:
+            cls.plot(h)
 
         return h, avg, std
 
@@ -824,6 +890,12 @@ class AnglesToRad(_Report):
     #: Part of figure and report titles.
     LABEL: Final = 'angle to radial direction in'
 
+    #: Radians-to-degrees conversion factor.
+    _RAD2DEG: Final = 180. / np.pi
+
+    #: (rad) Histogram bin width corresponding to 2 degrees.
+    _DX_RAD: Final = np.pi / 90.
+
     @classmethod
     def create(
             cls,
@@ -843,22 +915,25 @@ class AnglesToRad(_Report):
             sp: ListOfSpatialSystems,
     ) -> tuple[Histogram, list, list]:
 
-        data = [s.threshold_radial_dev(cls.tp.params['cell'].
-                                       regions.lamella.is_inside)
-                for s in sp]
-        data = [np.array([2.*np.pi - d if d >= np.pi else d for d in dd])
-                for dd in data]
+        is_inside = cls.tp.params['cell'].regions.lamella.is_inside
+        with ThreadPoolExecutor(max_workers=min(8, len(sp))) as ex:
+            data = [_fold_polar(np.asarray(d, dtype=np.float64))
+                    for d in ex.map(
+                        lambda s: s.threshold_radial_dev(is_inside), sp)]
+        flat, sizes = _flatten(data)
         avg, std = cls.tp.print_avgstd(cls.LABEL,
-                                       [d/np.pi*180. for d in data], cls.units)
+                                       (flat * cls._RAD2DEG, sizes),
+                                       cls.units)
 
         h = Histogram(
             cls.name,
-            Simulated()
-            .initialise(data, cls.fits_sim, dx=2.*np.pi/180., density=True,
-                        polar=cls.is_polar, halfpolar=cls.is_halfpolar),
+            Simulated.from_density(flat, cls.fits_sim, dx=cls._DX_RAD,
+                                   polar=cls.is_polar,
+                                   halfpolar=cls.is_halfpolar),
         )
         h.to_csv(cls.path_out)
-        cls.plot(h)
+        if cls.show or cls.save_plot:
+            cls.plot(h)
         return h, [avg], [std]
 
     @classmethod
@@ -914,15 +989,18 @@ class AgesByNode(_Report):
             sp: ListOfSpatialSystems,
     ) -> tuple[Histogram, list, list]:
 
-        data = [s.ages_cumulative for s in sp]
-        avg, std = cls.tp.print_avgstd(cls.LABEL, data, cls.units)
+        data = [np.ascontiguousarray(s.ages_cumulative, dtype=np.float64)
+                for s in sp]
+        flat, sizes = _flatten(data)
+        avg, std = cls.tp.print_avgstd(cls.LABEL, (flat, sizes), cls.units)
 
         h = Histogram(
             cls.name,
-            Simulated().initialise(data, cls.fits_sim, dx=10., density=True),
+            Simulated.from_density(flat, cls.fits_sim, dx=10.),
         )
         h.to_csv(cls.path_out)
-        cls.plot(h)
+        if cls.show or cls.save_plot:
+            cls.plot(h)
         return h, [avg], [std]
 
     @classmethod
@@ -989,15 +1067,18 @@ class AgesByFilament(_Report):
             sp: ListOfSpatialSystems,
     ) -> tuple[Histogram, list, list]:
 
-        data = [s.ages_by_filament for s in sp]
-        avg, std = cls.tp.print_avgstd(cls.LABEL, data, cls.units)
+        data = [np.ascontiguousarray(s.ages_by_filament, dtype=np.float64)
+                for s in sp]
+        flat, sizes = _flatten(data)
+        avg, std = cls.tp.print_avgstd(cls.LABEL, (flat, sizes), cls.units)
 
         h = Histogram(
             cls.name,
-            Simulated().initialise(data, cls.fits_sim, dx=10., density=True),
+            Simulated.from_density(flat, cls.fits_sim, dx=10.),
         )
         h.to_csv(cls.path_out)
-        cls.plot(h)
+        if cls.show or cls.save_plot:
+            cls.plot(h)
         return h, [avg], [std]
 
     @classmethod
@@ -28,18 +28,42 @@
 
 from __future__ import annotations
 import logging
+import re
 import struct
 
+from concurrent.futures import ThreadPoolExecutor
+
 from pathlib import Path
 from typing import Callable, Final, Optional, Union
 
 import numpy as np
-from scipy.spatial.distance import cdist
 
 from ..inout import Paths
 from ..inout import read_to_dtype
 from ..plasma_membrane import PlasmaMembrane
 
+#: Pre-compiled fixed headers of the raw simulation files:
+#: iteration u64, time f64, cell radius f32, mass u64, filament count u64.
+_HDR_POS: Final = struct.Struct('=QdfQQ')
+#: time f64, filament count u32.
+_HDR_AGES: Final = struct.Struct('=dI')
+
+#: Snapshot index embedded in the position file names.
+_SNAP_RE: Final = re.compile(r'_[0-9]+_')
+
+
+def _flatten(
+        data: list[np.ndarray]
+) -> tuple[np.ndarray, np.ndarray]:
+    """Concatenate per-system data arrays.
+
+    :param data: List of per-system data arrays.
+    :return: Concatenated array and sizes of the original arrays.
+    """
+
+    return np.concatenate(data), \
+        np.fromiter(map(len, data), dtype=np.intp, count=len(data))
+
 
 class FullDepth:
     """Instantaneous snapshots of complete cell microtubule subsystem
@@ -126,8 +150,10 @@ class FullDepth:
         self.figtitle3d: str = 'MT ' + self.type + ': \n' + self.signature
 
         # Positional coordinates and measures:
-        #: 3d positions of filament nodes.
-        self.pos = []
+        #: 3d positions of all nodes as one contiguous array.
+        self._pos_flat = np.empty((0, 3), dtype=np.float32)
+        #: Start offsets of the filaments within '_pos_flat'.
+        self._fil_offsets = np.zeros(1, dtype=np.int64)
         #: Lengths in 3d.
         self.len_total3d = np.empty(0)
         #: Lengths of xy projections.
@@ -146,6 +172,30 @@ class FullDepth:
         self.ages_cumulative = np.empty(0, dtype=float)
         self.ages_by_filament = np.empty(0, dtype=float)
 
+    @property
+    def pos(self) -> list[np.ndarray]:
+        """3d positions of filament nodes.
+
+        Per-filament (n, 3) arrays are views into a single contiguous
+        node buffer, so iterating them involves no copies, while the
+        vectorised methods operate on the buffer directly.
+        """
+
+        o = self._fil_offsets
+        return [self._pos_flat[o[i]:o[i + 1]]
+                for i in range(o.shape[0] - 1)]
+
+    @pos.setter
+    def pos(self, pp: list[np.ndarray]) -> None:
+
+        if len(pp):
+            self._pos_flat = np.concatenate(pp)
+            nn = np.fromiter(map(len, pp), dtype=np.int64, count=len(pp))
+            self._fil_offsets = np.r_[np.int64(0), np.cumsum(nn)]
+        else:
+            self._pos_flat = np.empty((0, 3), dtype=np.float32)
+            self._fil_offsets = np.zeros(1, dtype=np.int64)
+
     def read_positions(self) -> None:
         """Read in the 3d spatial coordinates for microtubule nodes.
 
@@ -160,19 +210,49 @@ class FullDepth:
 
         self.logger.info('Importing positions from ' +
                          str(self.fname_pos) + ' ...')
-        with open(self.fname_pos, 'rb') as f:
-            self.iteration = read_to_dtype(self.iteration, f)
-            self.time = read_to_dtype(self.time, f)
-            read_to_dtype(np.float32(), f)  # cell_rad
-            self.mtmass = read_to_dtype(self.mtmass, f)
-            self.nfilaments = read_to_dtype(self.nfilaments, f)
 
-            self.nnodes = np.zeros(self.nfilaments, dtype=np.uint32)
-            for i in range(self.nfilaments):
-                self.nnodes[i] = read_to_dtype(self.nnodes[i], f)
-                p = np.array(struct.unpack('fff' * self.nnodes[i],
-                                           f.read(3 * 4 * self.nnodes[i])))
-                self.pos.append(p.reshape((self.nnodes[i], 3)))
+        # The raw file interleaves per-filament node counts with the
+        # coordinates, so it cannot be memory-mapped directly. The first
+        # import repacks it into flat .npy sidecars; subsequent imports
+        # memory-map the coordinates and let the OS page cache handle
+        # residency.
+        flat_f = self.fname_pos.with_name(self.fname_pos.name + '_flat.npy')
+        nnod_f = self.fname_pos.with_name(self.fname_pos.name + '_nnodes.npy')
+
+        with open(self.fname_pos, 'rb') as f:
+            self.iteration, self.time, _cell_rad, \
+                self.mtmass, self.nfilaments = \
+                _HDR_POS.unpack(f.read(_HDR_POS.size))
+
+            raw_mtime = self.fname_pos.stat().st_mtime
+            if flat_f.is_file() and nnod_f.is_file() \
+                    and flat_f.stat().st_mtime >= raw_mtime \
+                    and nnod_f.stat().st_mtime >= raw_mtime:
+                self._pos_flat = np.load(flat_f, mmap_mode='r')
+                self.nnodes = np.load(nnod_f)
+            else:
+                self.nnodes = np.zeros(self.nfilaments, dtype=np.uint32)
+                self._pos_flat = np.empty((int(self.mtmass), 3),
+                                          dtype=np.float32)
+                off = 0
+                for i in range(self.nfilaments):
+                    self.nnodes[i] = read_to_dtype(self.nnodes[i], f)
+                    n = int(self.nnodes[i])
+                    # Read straight into the target slice, avoiding the
+                    # throwaway bytes of a read + frombuffer pair.
+                    f.readinto(self._pos_flat[off:off + n])
+                    off += n
+                # The sidecar cache is a pure optimization: on e.g. a
+                # read-only data directory the in-memory arrays just
+                # populated are used as is.
+                try:
+                    np.save(flat_f, self._pos_flat)
+                    np.save(nnod_f, self.nnodes)
+                except OSError as e:
+                    self.logger.info(
+                        f'Skipping position cache write: {e}')
+            self._fil_offsets = \
+                np.r_[np.int64(0), np.cumsum(self.nnodes)].astype(np.int64)
         self.logger.info('Positions import finished.')
 
         self.logger.info(f'Snapshot at time: {self.time} sec:')
@@ -191,40 +271,46 @@ class FullDepth:
 
         self.logger.info(f'Importing ages from {self.fname_ages} ...')
         with open(self.fname_ages, 'rb') as f:
-            time = np.float64
-            time = read_to_dtype(time, f)
+            time, nfilaments = _HDR_AGES.unpack(f.read(_HDR_AGES.size))
             assert time == self.time
-            nfilaments = np.uint32
-            nfilaments = read_to_dtype(nfilaments, f)
             assert nfilaments == self.nfilaments
             nnodes = np.zeros(nfilaments, dtype=np.uint32)
             self.ages = [np.empty(nn, dtype=np.float32) for nn in self.nnodes]
             for i in range(self.nfilaments):
                 nnodes[i] = read_to_dtype(nnodes[i], f)
                 assert nnodes[i] == self.nnodes[i]
-                self.ages[i] = np.array(read_to_dtype(self.ages[i],
-                                                      f, nnodes[i]))
+                f.readinto(self.ages[i])
 
         self.logger.info('Ages import finished.')
         self.logger.info('')
 
         self.ages_cumulative = np.concatenate(self.ages)
-        self.ages_by_filament = np.array([f.mean() for f in self.ages])
+        starts = np.r_[0, np.cumsum(self.nnodes[:-1])].astype(np.intp)
+        self.ages_by_filament = \
+            np.add.reduceat(self.ages_cumulative, starts) / self.nnodes
 
     def set_lengths(self) -> None:
         """Initialise class attributes related to microtubule dimensions.
         """
 
-        def norm_per_element(pp, d) -> list:
-            """Euclidean norm of dimension d."""
-            return [np.linalg.norm(np.diff(p[:, :d], axis=0), axis=1)
-                    for p in pp]
-
-        def len_total(nrm):
-            return np.array([np.sum(n) for n in nrm])
-
-        self.len_total3d = len_total(norm_per_element(self.pos, 3))
-        self.len_total2d = len_total(norm_per_element(self.pos, 2))
+        if not self._pos_flat.shape[0]:
+            return
+
+        # A single read of the positions serves both the 3d lengths and
+        # their xy projections: segment vectors are differenced once and
+        # per-filament totals are recovered from cumulative sums over
+        # windows that exclude the seams between consecutive filaments.
+        nn = np.diff(self._fil_offsets)
+        seg = np.diff(self._pos_flat, axis=0)
+        c3 = np.r_[0., np.cumsum(np.sqrt(np.einsum('ij,ij->i', seg, seg)),
+                                 dtype=np.float64)]
+        c2 = np.r_[0., np.cumsum(np.hypot(seg[:, 0], seg[:, 1]),
+                                 dtype=np.float64)]
+        ends = np.cumsum(nn)
+        starts = np.minimum(ends - nn, c3.shape[0] - 1)
+        hi = np.maximum(ends - 1, starts)
+        self.len_total3d = c3[hi] - c3[starts]
+        self.len_total2d = c2[hi] - c2[starts]
 
     def set_curvatures(self) -> None:
         """Initialise filament curvature-related attributes.
@@ -257,8 +343,9 @@ class FullDepth:
         """Initialise an array of edge distances to cell center in xy plane.
         """
 
+        ox, oy = self._pos_flat.dtype.type(self.origin[:2])
         self.center_dist_2d = \
-            [cdist(f[:, :2], np.array([self.origin[:2]])).T[0]
+            [np.hypot(f[:, 0] - ox, f[:, 1] - oy)
              for f in self.pos if f.shape[0]]
         end_length = 10
         self.center_dist_2d_ends = [f[-min(f.shape[0], end_length):]
@@ -271,23 +358,28 @@ class FullDepth:
 
         assert self.center_dist_2d is not None
 
-        nf = len(self.pos)
+        nf = self._fil_offsets.shape[0] - 1
         self.angles_radius = [np.empty(0)] * nf
-        for p, cd, k in zip(self.pos,
-                            self.center_dist_2d,
-                            list(range(nf))):
-            if p.shape[0]:
-                raddir = np.subtract(p[:, :2], self.origin[:2]).T / cd
-                segm = np.array([np.diff(p[:, 0]),
-                                 np.diff(p[:, 1])])
-                ornt = segm / np.linalg.norm(segm, axis=0)
-                self.angles_radius[k] = \
-                    np.arctan2(ornt[1, :], ornt[0, :]) - \
-                    np.arctan2(raddir[1, :-1], raddir[0, :-1])
-                self.angles_radius[k] = \
-                    np.where(self.angles_radius[k] < 0.,
-                             self.angles_radius[k] + 2. * np.pi,
-                             self.angles_radius[k])
+        nnodes = np.diff(self._fil_offsets)
+        if not self._pos_flat.shape[0]:
+            return
+
+        # Angles are invariant to the vector norms, so both the edge
+        # orientations and the radial directions reduce to arctan2 of
+        # raw differences, computed in one pass over all filaments.
+        allp = self._pos_flat[:, :2]
+        dxy = np.diff(allp, axis=0)
+        ornt_ang = np.arctan2(dxy[:, 1], dxy[:, 0])
+        ox, oy = allp.dtype.type(self.origin[:2])
+        rad_ang = np.arctan2(allp[:, 1] - oy, allp[:, 0] - ox)
+        a = (ornt_ang - rad_ang[:-1]) % allp.dtype.type(2. * np.pi)
+
+        # Per-filament views into the shared buffer; entries spanning
+        # the seams between consecutive filaments are skipped.
+        starts = self._fil_offsets[:-1]
+        for k, (o, n) in enumerate(zip(starts, nnodes)):
+            if n:
+                self.angles_radius[k] = a[o:o + n - 1]
 
     def threshold_radial_dev(
             self,
@@ -303,13 +395,11 @@ class FullDepth:
         :return: Filtered radial deviations.
         """
 
-        res = np.empty(0)
-        for c, a in zip(self.center_dist_2d, self.angles_radius):
-            ii = is_within_range(c)
-            if ii.size > 1:
-                res = np.hstack((res, a[ii[:-1]]))
+        chunks = [a[is_within_range(c)[:-1]]
+                  for c, a in zip(self.center_dist_2d, self.angles_radius)
+                  if c.size > 1]
 
-        return res
+        return np.concatenate(chunks) if chunks else np.empty(0)
 
     def threshold_tangential_dev(
             self,
@@ -325,17 +415,15 @@ class FullDepth:
         :return: filtered tangential deviations.
         """
 
-        res = np.empty(0)
+        halfpi = np.pi / 2.
+        chunks = []
         for c, a in zip(self.center_dist_2d, self.angles_radius):
             ii = is_within_range(c)
             ii[-1] = False
             aa = a[ii[:-1]]
-            over = aa > 90
-            aa[over] -= 90
-            aa[~over] = 90 - aa[~over]
-            res = np.hstack((res, aa))
+            chunks.append(np.where(aa > halfpi, aa - halfpi, halfpi - aa))
 
-        return res
+        return np.concatenate(chunks) if chunks else np.empty(0)
 
     @classmethod
     def create(
@@ -380,7 +468,12 @@ class FullDepth:
             else:
                 cls.all_items = [cls(i, rind) for i in snap_inds]
 
-            [s.initialise() for s in cls.all_items]
+            # Snapshots are independent data sets, and both the file
+            # reads and the NumPy passes release the GIL.
+            with ThreadPoolExecutor(
+                    max_workers=min(8, len(cls.all_items))) as ex:
+                for _ in ex.map(lambda s: s.initialise(), cls.all_items):
+                    pass
 
         return cls
 
@@ -432,16 +525,13 @@ class FullDepth:
         """Return snapshot indexes avalilable in simulation output.
         """
 
-        from os import listdir
-        from os.path import isfile, join
-        import re
-
         cof = 'coarse_' if params['iscoarse'] else 'fine_'
-        files = [f for f in listdir(path)
-                 if isfile(join(path, f)) and 'positions_' + cof in f]
-        rr = [re.search(r"_[0-9]+_", f) for f in files]
+        files = (f for f in Path(path).glob(f'positions_{cof}*')
+                 if f.suffix != '.npy')
 
-        return sorted([int(r.group()[1:-1]) for r in rr if r is not None])
+        return sorted(int(m.group()[1:-1]) for m in
+                      (_SNAP_RE.search(f.name) for f in files)
+                      if m is not None)
 
     @classmethod
     def print_avgstd(
@@ -458,18 +548,41 @@ class FullDepth:
         values are reported also for the 'v' elements independently.
 
         :param name: Name of the attribute processed.
-        :param v: List of data arrays.
+        :param v: List of data arrays or a pre-concatenated
+            (flat array, sizes) tuple as produced by ``_flatten``.
         :param units: Data units.
         :return: Average and standard deviation over the data arrays.
         """
 
-        assert len(v) == 1 or \
-               [isinstance(a, type(v[0])) for a in v[1:]]
-
         cls.logger.info(name + ' ' + cls.type + ': ')
 
-        m = np.array([np.mean(vv) for vv in v])
-        s = np.array([np.std(vv) for vv in v])
+        if isinstance(v, tuple):
+            flat, sizes = v
+            starts = np.r_[0, np.cumsum(sizes[:-1])]
+            # reduceat misreads zero-size segments (repeated indices
+            # yield the next segment's first element), so empty
+            # systems are masked to the nan that np.mean/np.std of an
+            # empty array would report.
+            nz = sizes > 0
+            denom = np.where(nz, sizes, 1)
+            if flat.size:
+                m = np.where(nz, np.add.reduceat(flat, starts),
+                             np.nan) / denom
+                # Sum of squares per system, fused and allocation-free:
+                # np.dot on segment views avoids the flat*flat
+                # temporary.
+                sumsq = np.fromiter((np.dot(g, g)
+                                     for g in np.split(flat, starts[1:])),
+                                    dtype=np.float64, count=len(sizes))
+                s = np.sqrt(np.where(nz, sumsq, np.nan) / denom - m * m)
+            else:
+                m = np.full(len(sizes), np.nan)
+                s = np.full(len(sizes), np.nan)
+        else:
+            assert len(v) == 1 or \
+                   [isinstance(a, type(v[0])) for a in v[1:]]
+            m = np.array([np.mean(vv) for vv in v])
+            s = np.array([np.std(vv) for vv in v])
         [cls.logger.info(f"    snap {sn if sn is not None else 'final'}: "
                          f"distr. mean {mm}  distr. std {ss} {units}")
          for sn, mm, ss, in zip(cls.snaps, m, s)]
@@ -484,6 +597,29 @@ class FullDepth:
 
         return mm, ms
 
+    def _segments3d(self) -> tuple[np.ndarray, np.ndarray]:
+        """Endpoint pairs of all filament edges for segment plotting.
+
+        Built from a sliding window over the contiguous node buffer,
+        with the rows spanning the seams between consecutive filaments
+        masked out.
+
+        :return: (E, 2, 3) array of edge endpoints and the boolean
+            mask selecting the edge rows among the first N - 1 nodes.
+        """
+
+        if self._pos_flat.shape[0] < 2:
+            return (np.empty((0, 2, 3), dtype=self._pos_flat.dtype),
+                    np.zeros(0, dtype=bool))
+
+        sw = np.lib.stride_tricks.sliding_window_view(
+            self._pos_flat, 2, axis=0)
+        mask = np.ones(self._pos_flat.shape[0] - 1, dtype=bool)
+        seams = self._fil_offsets[1:-1] - 1
+        mask[seams[(seams >= 0) & (seams < mask.shape[0])]] = False
+
+        return sw.transpose(0, 2, 1)[mask], mask
+
     def plot3d(
             self,
             color_mode: Optional[str] = None,
@@ -541,41 +677,29 @@ class FullDepth:
         ax.view_init(azim=0, elev=90)
 
         if with_mesh:
+            mvs = self.plasma_membrane.triangle_vertices
             if mesh_flattened:
-                mvs = np.copy(self.plasma_membrane.mesh.points)
-                mvs[:, 2] = 0.
-            else:
-                mvs = self.plasma_membrane.mesh.points
-            mvs = [mvs[c, :]
-                   for c in self.plasma_membrane.mesh.cells_dict['triangle']]
+                mvs = mvs.copy()
+                mvs[:, :, 2] = 0.
             p = art3d.Poly3DCollection(mvs, zsort='min', edgecolor=None,
                                        facecolor=(0.9, 0.9, 0.9, 0.2))
             ax.add_collection3d(p)
 
+        # All color modes render the same edge set as one collection;
+        # they only differ in the per-edge colors.
+        segs, mask = self._segments3d()
         if color_mode == 'by_height':
-            pp = [m.reshape(-1, 1, 3) for m in self.pos]
-            segs = np.concatenate([np.concatenate([m[:-1], m[1:]], axis=1)
-                                   for m in pp])
-            cc = np.concatenate([m[:-1, 2] for m in self.pos])
+            cc = self._pos_flat[:-1, 2][mask]
             norm = plt.Normalize(self.plasma_membrane.min_[2],
                                  self.plasma_membrane.max_[2])
             c = [(n, 0., 1. - n) for n in norm(cc)]
-            coll = art3d.Line3DCollection(segs, colors=c, lw=0.3)
-            ax.add_collection(coll)
             # fig.colorbar(coll, ax=ax)
-
         elif color_mode == 'by_age':
-            pp = [m.reshape(-1, 1, 3) for m in self.pos]
-            segs = np.concatenate([np.concatenate([m[:-1], m[1:]], axis=1)
-                                   for m in pp])
-            cc = np.concatenate([a[:-1] for a in self.ages])
+            cc = self.ages_cumulative[:-1][mask]
             c = plt.cm.jet(cc / cc.max())
-            coll = art3d.Line3DCollection(segs, colors=c, lw=0.3)
-            ax.add_collection(coll)
-
         else:
-            for m in self.pos:
-                ax.plot(m[:, 0], m[:, 1], m[:, 2], c='r', lw=0.3)
+            c = 'r'
+        ax.add_collection(art3d.Line3DCollection(segs, colors=c, lw=0.3))
 
         if export:
             self.export_to_svg(color_mode)
@@ -597,7 +721,6 @@ class FullDepth:
         """
 
         import gzip
-        import copy
 
         magn = 30.
         axlim = max([1.1 * self.plasma_membrane.min_.min(),
@@ -606,32 +729,38 @@ class FullDepth:
         h = magn * axlim
         fname = self.paths.data_out / f"cell_{self.type}_{color_mode}.svg.gz"
 
-        with gzip.GzipFile(fname, 'w') as o:
-            o.write(
-                f"<svg width='{w}' height='{h}' preserveAspectRatio='meet | "
-                f"slice' xmlns='http://www.w3.org/2000/svg'>"
-                .encode())
-
-            if self.plasma_membrane is not None:
-                for f in self.plasma_membrane.mesh.cells_dict['triangle']:
-                    p = self.plasma_membrane.mesh.points[f, :2] * magn/2 + w/2
-                    o.write("<polygon points='".encode())
-                    o.write(f"{p[0, 0]} {p[0, 1]}, "
-                            f"{p[1, 0]} {p[1, 1]}, "
-                            f"{p[2, 0]} {p[2, 1]}".encode())
-                    o.write("' stroke='none' "
-                            "fill='rgba(0.9, 0.9, 0.9, 0.07)'/>\n".encode())
-
-            for f in copy.deepcopy(self.pos):
-                f *= magn / 2
-                f += w / 2
-                o.write("<polyline points='".encode())
-                o.write(f"{f[0, 0]} {f[0, 1]} ".encode())
-                for i in range(1, f.shape[0]):
-                    o.write(f"{f[i, 0]} {f[i, 1]} ".encode())
-                o.write("' stroke='blue' fill='none' stroke-width='1'/>\n"
-                        .encode())
-            o.write("</svg>".encode())
+        # The whole document is assembled in memory and compressed with
+        # a single write: gzip handles one large buffer much better than
+        # thousands of per-node writes.
+        parts = [
+            f"<svg width='{w}' height='{h}' preserveAspectRatio='meet | "
+            f"slice' xmlns='http://www.w3.org/2000/svg'>"
+            .encode()
+        ]
+
+        if self.plasma_membrane is not None:
+            tri = np.char.mod(
+                '%g',
+                self.plasma_membrane.triangle_vertices[..., :2]
+                * magn/2 + w/2
+            ).reshape(-1, 6)
+            parts.extend(
+                (f"<polygon points='{t[0]} {t[1]}, {t[2]} {t[3]}, "
+                 f"{t[4]} {t[5]}' stroke='none' "
+                 "fill='rgba(0.9, 0.9, 0.9, 0.07)'/>\n").encode()
+                for t in tri)
+
+        xy = np.char.mod('%g', self._pos_flat[:, :2] * (magn/2) + w/2)
+        o = self._fil_offsets
+        parts.extend(
+            ("<polyline points='" +
+             ' '.join(xy[o[i]:o[i + 1]].ravel()) +
+             "' stroke='blue' fill='none' stroke-width='1'/>\n").encode()
+            for i in range(o.shape[0] - 1))
+        parts.append("</svg>".encode())
+
+        with gzip.GzipFile(fname, 'w') as out:
+            out.write(b''.join(parts))
 
 
 class Slice(FullDepth):
@@ -684,33 +813,26 @@ class Slice(FullDepth):
         """
 
         assert len(pos)
-        self.pos = []
-        self.fi = []
-        self.ni = []
-        sfi = -1
-        sni = int
-        for p in pos:
-            # Assume that previous node is not valid.
-            # Hence, start new filament slice.
-            pnv = False
-            for j in range(p.shape[0]):
-                if self.zlimits['bottom'] < p[j, 2] < self.zlimits['top']:
-                    if not pnv:  # start new filament slice
-                        sfi += 1
-                        sni = 1
-                        self.pos.append([])
-                        self.fi.append([])
-                        self.ni.append([])
-                        pnv = True
-                    self.pos[sfi].append(p[j, :])  # node positions
-                    self.fi[sfi].append(sfi)  # filament slice indexes
-                    self.ni[sfi].append(sni)  # node index
-                    sni += 1
-                else:
-                    if pnv:
-                        pnv = False
-
-        self.pos = [np.array(p) for p in self.pos]
+
+        # Filament slices are runs of consecutive in-slice nodes not
+        # crossing filament boundaries, so the per-node double loop
+        # reduces to mask arithmetic on the concatenated positions.
+        flat = np.concatenate(pos)
+        keep = (self.zlimits['bottom'] < flat[:, 2]) & \
+               (flat[:, 2] < self.zlimits['top'])
+        prev = np.r_[False, keep[:-1]]
+        nn = np.fromiter(map(len, pos), dtype=np.intp, count=len(pos))
+        prev[np.r_[0, np.cumsum(nn[:-1])]] = False  # filament starts
+        is_start = keep & ~prev
+
+        kept = flat[keep]
+        rid = np.cumsum(is_start)[keep]  # run (= filament slice) index
+        bounds = np.flatnonzero(np.diff(rid)) + 1
+        self.pos = np.split(kept, bounds) if kept.shape[0] else []
+        self.fi = [[k] * p.shape[0]  # filament slice indexes
+                   for k, p in enumerate(self.pos)]
+        self.ni = [list(range(1, p.shape[0] + 1))  # node indexes
+                   for p in self.pos]
         self.nfilaments = len(self.pos)
         self.nnodes = np.array([p.shape[0] for p in self.pos])
         self.mtmass = np.sum(self.nnodes)
@@ -743,7 +865,12 @@ class Slice(FullDepth):
 
         if init:
             cls.all_items = [cls(f) for f in full.all_items]
-            [s.initialise() for s in cls.all_items]
+            # Snapshots are independent data sets, and both the file
+            # reads and the NumPy passes release the GIL.
+            with ThreadPoolExecutor(
+                    max_workers=min(8, len(cls.all_items))) as ex:
+                for _ in ex.map(lambda s: s.initialise(), cls.all_items):
+                    pass
 
         return cls
 
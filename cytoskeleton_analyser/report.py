@@ -55,6 +55,9 @@ class Report(ABC):
     fits_exp: list[tuple] = []
     show: bool
 
+    #: If False (and ``show`` is False), figure rendering is skipped.
+    save_plot: bool = True
+
     @classmethod
     def __create(
             cls,
@@ -89,6 +92,15 @@ class Report(ABC):
             available in the Histogram class.
         """
         h, avgs, stds = has
+
+        # With neither fits nor statistics the summary would hold no
+        # information; skip its allocation and the file write.
+        has_any = bool(h.simulated.fits) or \
+            (h.experimental is not None and bool(h.experimental.fits))
+        if not has_any and avgs is None:
+            cls.logger.info('')
+            return
+
         s = Summary()
         if h.experimental is None:
             s.init(['simulated'], ibest, [h.simulated.fits], avgs, stds)
@@ -116,11 +128,14 @@ class Report(ABC):
 
         cls.logger.info('Restoring ' + cls.name + ':')
 
-        summary = cls.log_stats(path)
+        # The summary file is parsed once and shared by the stats
+        # logging and the fit restoration.
+        smr = Summary().read(path, cls.name)
+        summary = cls.log_stats(path, smr)
         h = Histogram(cls.name).from_csv(path)
         h.simulated.polar = cls.is_polar
         h.simulated.halfpolar = cls.is_halfpolar
-        cls._restore_fits(path, h)
+        cls._restore_fits(path, h, smr)
         cls.plot(h)
 
         cls.logger.info('')
@@ -132,47 +147,51 @@ class Report(ABC):
     def _restore_fits(
             cls,
             path: Path,
-            hh: Histogram
+            hh: Histogram,
+            smr: Optional[Summary] = None,
     ) -> None:
         """Restore fitted models for the reported feature from a file.
 
          :param path: Full (dir + specific name) name of the input file.
          :param hh: Histogram object to store the models.
+         :param smr: Pre-parsed summary, to avoid re-reading the file.
         """
 
-        smr = Summary().read(path, cls.name)
+        if smr is None:
+            smr = Summary().read(path, cls.name)
         if smr is None:
             return
 
-        smr = smr.data
-        fc = [fit.class_from_classname(fit, s['model']['name'])
-              if s['model'] is not None and s['model']['name'] is not None
-              else None for s in smr]
-
-        ee = [e.create() if hasattr(e, 'create') else e for e in fc]
-        cc = [fit.subtype_from_classname(e, s['model']['name'])
-              if e is not None else None for e, s in zip(ee, smr)]
-
-        for c, d, h in zip(cc, smr, hh.elements()):
-            if c is not None:
-                cls.logger.info(f"{d['name']}: ")
-                h.fits = [
-                    fit.restore(c, d['model']['p'], cls.units, h.bc, h.h,
-                                fit.method_from_classname(c,
-                                                          d['model']['name']))
-                ]
+        # One pass over the summary resolves the model class, its
+        # subtype and the fitting method for each histogram element.
+        for d, h in zip(smr.data, hh.elements()):
+            name = d['model']['name'] if d['model'] is not None else None
+            if name is None:
+                continue
+            e = fit.class_from_classname(fit, name)
+            if hasattr(e, 'create'):
+                e = e.create()
+            c = fit.subtype_from_classname(e, name)
+            cls.logger.info(f"{d['name']}: ")
+            h.fits = [
+                fit.restore(c, d['model']['p'], cls.units, h.bc, h.h,
+                            fit.method_from_classname(c, name))
+            ]
 
     @classmethod
     def log_stats(
             cls,
-            path: Path
+            path: Path,
+            smr: Optional[Summary] = None,
     ) -> Optional[Summary]:
         """Add a log record describing the restored attribute.
 
         :param path: Path to the input file of the input file.
+        :param smr: Pre-parsed summary, to avoid re-reading the file.
         """
 
-        smr = Summary().read(path, cls.name)
+        if smr is None:
+            smr = Summary().read(path, cls.name)
         if smr is None:
             return
         smr = smr.data
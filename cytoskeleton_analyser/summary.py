@@ -32,6 +32,12 @@ from logging import Logger
 from pathlib import Path
 from typing import Optional, Sequence
 
+try:
+    # Optional C-extension serializer; used when available.
+    import orjson
+except ImportError:
+    orjson = None
+
 from .inout import underscored
 
 
@@ -67,17 +73,36 @@ class Summary:
             stds: Optional[list[float]] = None,
     ) -> Summary:
 
-        bms = [fits[i][ibest[i]].summary() if len(fits[i]) else None
-               for i in range(len(names))]
-
-        self.data = [{'name': n, 'model': m} for n, m in zip(names, bms)]
-        if avgs is not None:
-            self.data = [{**d, 'avg': a} for a, d in zip(avgs, self.data)]
-        if stds is not None:
-            self.data = [{**d, 'std': s} for s, d in zip(stds, self.data)]
+        bms = [f[i].summary() if f else None
+               for f, i in zip(fits, ibest)]
+
+        # Each row is composed in one pass, avoiding the dict copies
+        # of chained {**d, ...} comprehensions.
+        rows = []
+        for i, (n, m) in enumerate(zip(names, bms)):
+            row = {'name': n, 'model': m}
+            if avgs is not None:
+                row['avg'] = avgs[i]
+            if stds is not None:
+                row['std'] = stds[i]
+            rows.append(row)
+        self.data = rows
 
         return self
 
+    @staticmethod
+    def _path(
+            path: Path,
+            name: str
+    ) -> Path:
+        """Resolve the summary file name for the given feature.
+
+        :param path: File position on the data storage device.
+        :param name: File name without suffix.
+        """
+
+        return (path / underscored(name)).with_suffix('.json')
+
     def add_items(
             self,
             d: Sequence[dict],
@@ -87,14 +112,10 @@ class Summary:
         :param d: Data to be included.
         """
 
-        k = len(self.data)
-        inds = range(k)
-        d *= k
-
-        for i in inds:
-            for k, v in d[i].items():
-                if k not in self.data[i]:
-                    self.data[i] = self.data[i] | {k: v}
+        src = d * len(self.data) if len(d) == 1 else d
+        for target, dd in zip(self.data, src):
+            for key, v in dd.items():
+                target.setdefault(key, v)
 
     def save(
             self,
@@ -107,11 +128,20 @@ class Summary:
         :param name: File name without suffix.
         """
 
-        fname = (path / underscored(name)).with_suffix('.json')
+        fname = self._path(path, name)
         self.logger.info('Saving summary: ' + str(fname) + '\n')
 
-        with open(fname, 'w') as f:
-            json.dump(self.data, f)
+        if orjson is not None:
+            with open(fname, 'wb') as f:
+                f.write(orjson.dumps(self.data,
+                                     option=orjson.OPT_SERIALIZE_NUMPY))
+        else:
+            # Compact separators and a large write buffer keep the
+            # stdlib fallback close to the orjson path; ensure_ascii
+            # off avoids escaping non-ASCII unit labels.
+            with open(fname, 'w', buffering=1 << 20) as f:
+                json.dump(self.data, f, separators=(',', ':'),
+                          ensure_ascii=False)
 
     def read(
             self,
@@ -125,13 +155,18 @@ class Summary:
         :return: Initialized instance of of this class.
         """
 
-        fname = (path / underscored(name)).with_suffix('.json')
-        if not Path(fname).is_file():
+        fname = self._path(path, name)
+        # EAFP: opening directly avoids a redundant stat on the happy
+        # path.
+        try:
+            f = open(fname, 'rb')
+        except FileNotFoundError:
             self.logger.info('Skipping Fit Summary: file ' +
                              str(fname) + ' is not available.\n')
             return None
         self.logger.info('Reading summary: ' + str(fname) + '\n')
-        with open(fname, 'r') as f:
-            self.data = json.load(f)
+        with f:
+            self.data = orjson.loads(f.read()) if orjson is not None \
+                else json.loads(f.read())
 
         return self
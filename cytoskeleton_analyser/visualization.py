@@ -27,21 +27,89 @@
 """
 
 from __future__ import annotations
+import functools
 import gzip
-import itertools
-from dataclasses import dataclass
+import io
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from pathlib import Path
-from typing import Optional, Sequence
+from typing import TYPE_CHECKING, Optional, Sequence
 
-import matplotlib.colors as mcolors
-import matplotlib.pyplot as plt
 import numpy as np
 
-import cytoskeleton_analyser.fitting as fitting
+if TYPE_CHECKING:
+    import matplotlib.colors as mcolors
+    import matplotlib.pyplot as plt
 
 
-# Turn interactive plotting off.
-plt.ioff()  # to enable plotting to disk only
+@functools.lru_cache(maxsize=1)
+def _get_plt():
+    """Import and configure matplotlib.pyplot on first use.
+
+    Keeping the import out of module scope spares report-only code
+    paths the cost of the full matplotlib import tree.
+    """
+
+    import matplotlib.pyplot as plt
+
+    # Turn interactive plotting off.
+    plt.ioff()  # to enable plotting to disk only
+
+    return plt
+
+
+#: If True, Figure/Axes trees are pooled by layout and reused between
+#: plots instead of being created and torn down per plot.
+pool_figures: bool = True
+
+_fig_cache: dict[tuple, tuple] = {}
+
+#: Line styles cycled over by non-best fit curves.
+_LINESTYLES: tuple[str, ...] = ('--', '-.', ':')
+
+
+def _get_fig(
+        ncols: int = 1,
+        figsize: Optional[tuple[float, float]] = None,
+        sharey: bool = False,
+) -> tuple:
+    """Return a (figure, axes) pair for the requested layout.
+
+    With ``pool_figures`` enabled, an existing figure of the same
+    layout is cleared and reused; otherwise a fresh one is created.
+    """
+
+    plt = _get_plt()
+    key = (ncols, figsize, sharey)
+    if pool_figures and key in _fig_cache:
+        fig, axes = _fig_cache[key]
+        # Figures decorated beyond their base axes (e.g. with
+        # colorbars) are evicted rather than reused.
+        if len(fig.axes) == ncols:
+            plt.figure(fig.number)  # make current for pyplot calls
+            for a in np.ravel(axes):
+                a.clear()
+            return fig, axes
+        del _fig_cache[key]
+        plt.close(fig)
+
+    fig, axes = plt.subplots(ncols=ncols, figsize=figsize, sharey=sharey)
+    if pool_figures:
+        _fig_cache[key] = (fig, axes)
+
+    return fig, axes
+
+
+def _release_fig(fig) -> None:
+    """Dispose of a figure obtained from :func:`_get_fig`.
+
+    Pooled figures are kept alive for reuse; otherwise the figure is
+    closed.
+    """
+
+    if not pool_figures:
+        _get_plt().close(fig)
 
 
 class Colors:
@@ -55,11 +123,11 @@ class Colors:
         """:param cm: Name of matplotlib.pyplot colormap.
         """
 
-        self.cmap = plt.get_cmap(cm)
+        self.cmap = _get_plt().get_cmap(cm)
         self.n = None
-        self.strong: Optional[list] = None
-        self.weak: Optional[list] = None
-        self.all: Optional[list] = None
+        self.strong: Optional[np.ndarray] = None
+        self.weak: Optional[np.ndarray] = None
+        self.all: Optional[np.ndarray] = None
 
     def set_strong_weak(
             self,
@@ -73,10 +141,10 @@ class Colors:
 
         inds = np.arange(0, len(self.cmap.colors), 2)
         self.n = n
-        _strong = self.cmap(inds)
-        _weak = self.cmap(inds + 1)
-        self.strong = [Colors.cycler(_strong, i) for i in range(self.n)]
-        self.weak = [Colors.cycler(_weak, i) for i in range(self.n)]
+        # A single modular gather replaces the per-index Python cycling.
+        idx = np.arange(n) % len(inds)
+        self.strong = self.cmap(inds)[idx]
+        self.weak = self.cmap(inds + 1)[idx]
 
         return self
 
@@ -94,8 +162,7 @@ class Colors:
 
         inds = np.arange(0, len(self.cmap.colors))
         self.n = n
-        _all = self.cmap(inds)
-        self.all = [Colors.cycler(_all, i) for i in range(self.n)]
+        self.all = self.cmap(inds)[np.arange(n) % len(inds)]
 
         return self
 
@@ -122,6 +189,12 @@ class Multiplot:
 
     @dataclass
     class Data:
+        # Declared manually (rather than via dataclass(slots=True),
+        # 3.10+) to drop the per-instance __dict__ while keeping the
+        # 3.9 floor.
+        __slots__ = ('figtitle', 'axtitles', 'x', 'x_label',
+                     'y', 'y_label', 'fit', 'colormap')
+
         figtitle: str
         axtitles: Optional[str]
         x: list[np.ndarray]
@@ -143,8 +216,17 @@ class Multiplot:
         No other method of this class needs to be called.
         """
 
+        # Contiguous float32 arrays halve the bytes matplotlib's
+        # transform pipeline walks; converting here avoids repeating
+        # the conversion for the x array shared between the axes.
+        data = replace(
+            data,
+            x=np.ascontiguousarray(data.x, dtype=np.float32),
+            y=[np.ascontiguousarray(y, dtype=np.float32) for y in data.y],
+        )
+
         n = len(data.y)
-        self.fig, ax = plt.subplots(
+        self.fig, ax = _get_fig(
             ncols=n,
             sharey=True,
             figsize=(n*5., 5.),   # default: (6.4, 4.8)
@@ -155,10 +237,16 @@ class Multiplot:
 
         colors = Colors(data.colormap).set_strong_weak(n)
 
-        for i in range(n):
-            d = self._extract_axis_data(data, i)
-            self._set_axis(ax[i], d, {'weak': colors.weak[i],
-                                      'strong': colors.strong[i]})
+        # The NumPy-only vertex assembly releases the GIL and is run
+        # concurrently; matplotlib itself is not thread-safe, so the
+        # Artists are created serially afterwards.
+        dd = [self._extract_axis_data(data, i) for i in range(n)]
+        cc = [{'weak': colors.weak[i], 'strong': colors.strong[i]}
+              for i in range(n)]
+        with ThreadPoolExecutor(max_workers=min(n, os.cpu_count())) as ex:
+            built = list(ex.map(self._build_artists, dd, cc))
+        for a, d, b in zip(ax, dd, built):
+            self._set_axis(a, d, b)
         self.fig.suptitle(data.figtitle)
         #    lines_labels = [ax.get_legend_handles_labels() for ax in fig.axes]
         #    handles, labels = [sum(lol, []) for lol in zip(*lines_labels)]
@@ -169,44 +257,86 @@ class Multiplot:
             save_plt(exportfile, gzipped)
 
         if show:
-            plt.show()
+            _get_plt().show()
         else:
-            plt.close(self.fig)
+            _release_fig(self.fig)
 
     @staticmethod
-    def _set_axis(
-            ax: plt.Axes,
+    def _build_artists(
             d: Data,
             color: dict,
-    ) -> None:
-        """Set an instance of figure axes.
+    ) -> dict:
+        """Assemble plain ndarray vertex and style data for one axis.
+
+        Involves no matplotlib calls, so it is safe to run
+        concurrently for independent axes.
 
-        :param ax: Axes to set.
         :param d: Data container.
         :param color: dict containing weak and strong color tints.
+        :return: dict with scatter and line specifications.
         """
 
-        ls = itertools.cycle(['--', '-.', ':'])
-        ax.set_xlabel(d.x_label)
-        if d.axtitles is not None:
-            ax.set_title(d.axtitles)
-
-        cr = color['weak'] if d.fit is not None and len(d.fit) else \
-            color['strong']
-        ax.scatter(d.x, d.y, color=cr, s=0.2, marker='.', label='_nolegend_')
+        import cytoskeleton_analyser.fitting as fitting
 
+        x = d.x
+        cw, cs = color['weak'], color['strong']
+        cr = cw if d.fit is not None and len(d.fit) else cs
+        segs, clr, lws, lss = [], [], [], []
         if d.fit is not None:
-            for f in d.fit:
+            x01 = np.array([x[0], x[-1]])
+            for k, f in enumerate(d.fit):
                 if f is None or fitting.is_mock(f):
                     continue
                 if f.isbest:
-                    ax.plot(d.x, f.prediction, c=color['strong'],
-                            lw=1., label='_nolegend_')
-                    ax.plot([d.x[0], d.x[-1]], [f.saturation, f.saturation],
-                            c=[0.3]*3, lw=0.25, label='_nolegend_')
+                    segs.append(np.column_stack([x, f.prediction]))
+                    clr.append(cs)
+                    lws.append(1.)
+                    lss.append('-')
+                    segs.append(np.column_stack(
+                        [x01, np.full(2, f.saturation)]))
+                    clr.append([0.3]*3)
+                    lws.append(0.25)
+                    lss.append('-')
                 else:
-                    ax.plot(d.x, f.prediction, c='k', lw=0.5,
-                            ls=next(ls), label='_nolegend_')
+                    segs.append(np.column_stack([x, f.prediction]))
+                    clr.append('k')
+                    lws.append(0.5)
+                    lss.append(_LINESTYLES[k % 3])
+
+        return {'scatter': (x, d.y, cr), 'lines': (segs, clr, lws, lss)}
+
+    @staticmethod
+    def _set_axis(
+            ax: plt.Axes,
+            d: Data,
+            artists: dict,
+    ) -> None:
+        """Set an instance of figure axes from prebuilt artist data.
+
+        :param ax: Axes to set.
+        :param d: Data container.
+        :param artists: Artist specifications from ``_build_artists``.
+        """
+
+        ax.set_xlabel(d.x_label)
+        if d.axtitles is not None:
+            ax.set_title(d.axtitles)
+
+        # Rasterizing the scatter keeps vector exports from
+        # serializing one path per marker.
+        x, y, cr = artists['scatter']
+        ax.scatter(x, y, color=cr, s=0.2, marker='.', rasterized=True,
+                   label='_nolegend_')
+
+        # All fit curves of the axis are drawn as a single collection
+        # instead of one Line2D per fit.
+        segs, clr, lws, lss = artists['lines']
+        if segs:
+            from matplotlib.collections import LineCollection
+
+            ax.add_collection(LineCollection(
+                segs, colors=clr, linewidths=lws, linestyles=lss,
+                label='_nolegend_'))
         # ax.grid(True)
 
     @staticmethod
@@ -256,7 +386,7 @@ def pie(
     :param show: If True, display the plots.
     """
 
-    fig, ax = plt.subplots()
+    fig, ax = _get_fig()
     ax.pie(sizes,
            explode=explode,
            labels=labels,
@@ -270,9 +400,9 @@ def pie(
         save_plt(exportfile, gzipped)
 
     if show:
-        plt.show()
+        _get_plt().show()
     else:
-        plt.close(fig)
+        _release_fig(fig)
 
 
 def colormesh_plot(
@@ -296,7 +426,7 @@ def colormesh_plot(
     :param show: If True, display the plots.
     """
 
-    fig, (ax) = plt.subplots(1, 1)
+    fig, (ax) = _get_fig()
     im = ax.pcolormesh(h, cmap=cmap, norm=norm)
     fig.colorbar(im, ax=ax)
     ax.set_aspect('equal')
@@ -306,15 +436,16 @@ def colormesh_plot(
     if exportfile is not None:
         save_plt(exportfile, frmt='tiff', gzipped=False)
     if show:
-        plt.show()
+        _get_plt().show()
     else:
-        plt.close(fig)
+        _release_fig(fig)
 
 
 def save_plt(
         exportfile: Path,
         gzipped: bool = True,
         frmt: str = 'svg',
+        raster: bool = False,
 ) -> None:
     """Save a matplotlib.pyplot plot as an image file.
 
@@ -323,15 +454,38 @@ def save_plt(
     :param gzipped: If True, apply .gz compression on top of the
         image format extension.
     :param frmt: Image file format: default: '.svg'.
+    :param raster: If True, rasterize the already drawn Agg canvas and
+        encode it with Pillow, bypassing the pure-Python vector
+        backend. ``frmt`` should then name a raster format, and
+        ``gzipped`` is ignored.
     """
 
     assert len(str(exportfile).split()) == 1
 
+    plt = _get_plt()
+    if raster:
+        from PIL import Image
+
+        fig = plt.gcf()
+        fig.canvas.draw()
+        img = Image.fromarray(np.asarray(fig.canvas.buffer_rgba()))
+        img.save(exportfile.with_suffix(f'.{frmt}'), format=frmt.upper(),
+                 **({'compression': 'tiff_lzw'} if frmt == 'tiff' else {}))
+        return
+
 #    exportfile = underscored(exportfile)
-    kw = {"compression": "tiff_lzw"} if frmt == 'tiff' else {}
+    kw = {'pil_kwargs': {'compression': 'tiff_lzw'}} \
+        if frmt == 'tiff' else {}
+
+    # Render once into memory, so the compressor sees one contiguous
+    # block instead of matplotlib's many small writes; a light
+    # compression level keeps the export CPU-bound on rendering, with
+    # a marginal size penalty for the textual svg output.
+    buf = io.BytesIO()
+    plt.savefig(buf, format=frmt, **kw)
     if gzipped:
-        with gzip.open(exportfile.with_suffix(f'.{frmt}.gz'), 'wb') as f:
-            plt.savefig(f, format=frmt)
+        with gzip.open(exportfile.with_suffix(f'.{frmt}.gz'), 'wb',
+                       compresslevel=1) as f:
+            f.write(buf.getbuffer())
     else:
-        with open(exportfile.with_suffix(f'.{frmt}'), 'wb') as f:
-            plt.savefig(f, format=frmt, pil_kwargs=kw)
+        exportfile.with_suffix(f'.{frmt}').write_bytes(buf.getbuffer())
@@ -1,25 +1,31 @@
+import io
+
 import numpy as np
 import pytest
 from pathlib import Path
 
 from cytoskeleton_analyser.inout import flatten_dict
+from cytoskeleton_analyser.inout import flatten_dict_compiled
 from cytoskeleton_analyser.inout import read_to_dtype
 from cytoskeleton_analyser.inout import read_to_ndarray
 from cytoskeleton_analyser.inout import Reader
+from cytoskeleton_analyser.inout import read_records
+from cytoskeleton_analyser.inout import read_to_ndarray_bulk
 
 
 class TestReader:
 
-    @pytest.fixture
+    @pytest.fixture(scope='session')
     def text_data_path(self):
 
         return Path(__file__).parent/'data'/'reader_data.txt'
 
-    @pytest.fixture
-    def data(self, text_data_path):
+    # The file content is read once per module; each test parses it
+    # from an in-memory buffer instead of reopening the file.
+    @pytest.fixture(scope='module')
+    def text_data(self, text_data_path):
 
-        with open(text_data_path, 'r') as f:
-            yield f
+        return text_data_path.read_text()
 
     def test_skip_lines(self, text_data_path):
 
@@ -27,34 +33,34 @@ class TestReader:
             r.skip_lines(2)
             assert r.f.readline() == "third line\n"
 
-    def test_value(self, text_data_path):
+    def test_value(self, text_data):
 
-        with Reader(text_data_path) as r:
+        with Reader(io.StringIO(text_data)) as r:
             r.skip_lines(3)
             assert r.value(2) == "data3"
 
-    def test_array(self, text_data_path):
+    def test_array(self, text_data):
 
         ee = [6.e3, 7.e3, 8.e3]
-        with Reader(text_data_path) as r:
+        with Reader(io.StringIO(text_data)) as r:
             r.skip_lines(5)
             aa = r.array(2)
         for e, a in zip(ee, aa):
             assert e == a
 
-    def test_array_float(self, text_data_path):
+    def test_array_float(self, text_data):
 
         ee = [6.e3, 7.e3, 8.e3]
-        with Reader(text_data_path) as r:
+        with Reader(io.StringIO(text_data)) as r:
             r.skip_lines(5)
             aa = r.array_float(2)
         for e, a in zip(ee, aa):
             assert e == a
 
-    def test_array_int(self, text_data_path):
+    def test_array_int(self, text_data):
 
         ee = [6000, 7000, 8000]
-        with Reader(text_data_path) as r:
+        with Reader(io.StringIO(text_data)) as r:
             r.skip_lines(5)
             aa = r.array_float(2)
         for e, a in zip(ee, aa):
@@ -64,16 +70,43 @@ class TestReader:
 binary_data = [3.54, 95.3, 74.12, 9, 8, 47]
 binary_data_path = Path(__file__).parent/'data'/'read_to_data'
 
+# Layout of the binary fixture: one record of three floats followed
+# by three ints.
+BIN_DTYPE = np.dtype([('floats', '<f4', (3,)), ('ints', '<i4', (3,))])
+
+
+def _binary_record(use_memmap: bool = True) -> np.void:
+    """Zero-copy view of the fixture record, backed by the page cache.
+
+    One mmap call replaces per-field reads; falls back to np.fromfile
+    where memory mapping is unavailable.
+    """
+
+    if use_memmap:
+        try:
+            return np.memmap(binary_data_path, dtype=BIN_DTYPE,
+                             mode='r', shape=(1,))[0]
+        except (OSError, ValueError):
+            pass
+    return np.fromfile(binary_data_path, dtype=BIN_DTYPE)[0]
+
+
+binary_record = _binary_record()
+
+
+def test_binary_record():
+
+    assert binary_record['floats'] == pytest.approx(binary_data[:3])
+    assert (binary_record['ints'] == binary_data[3:]).all()
+
 
 def test_read_to_dtype():
 
     with open(binary_data_path, 'rb') as f:
-        for i in range(3):
-            a = read_to_dtype(np.float32(), f, 1)
-            assert a == pytest.approx(binary_data[i])
-        for i in range(3):
-            b = read_to_dtype(np.int32(), f, 1)
-            assert b == binary_data[i+3]
+        a = read_to_dtype(np.empty(3, dtype=np.float32), f, 3)
+        b = read_to_dtype(np.empty(3, dtype=np.int32), f, 3)
+    np.testing.assert_allclose(a, binary_record['floats'])
+    np.testing.assert_array_equal(b, binary_record['ints'])
 
 
 def test_read_to_ndarray():
@@ -82,11 +115,47 @@ def test_read_to_ndarray():
         a = np.empty(3, dtype=np.float32)
         for i in range(3):
             read_to_ndarray(a, f, i)
-            assert a[i] == pytest.approx(binary_data[i])
         b = np.empty(3, dtype=np.int32())
         for i in range(3):
             read_to_ndarray(b, f, i)
-            assert b[i] == pytest.approx(binary_data[i+3])
+    # One vectorised comparison per block instead of a per-element
+    # assert inside the loops.
+    np.testing.assert_allclose(a, binary_record['floats'])
+    np.testing.assert_array_equal(b, binary_record['ints'])
+
+
+def test_read_records():
+
+    with open(binary_data_path, 'rb') as f:
+        ff, ii = read_records(f, 3, 3)
+    assert ff == pytest.approx(binary_data[:3])
+    assert (ii == binary_data[3:]).all()
+
+
+def test_read_to_ndarray_bulk():
+
+    with open(binary_data_path, 'rb') as f:
+        a = np.empty(3, dtype=np.float32)
+        read_to_ndarray(a, f, 0, count=3)
+        assert a == pytest.approx(binary_data[:3])
+        b = np.empty(3, dtype=np.int32)
+        read_to_ndarray(b, f, 0, count=3)
+        assert b == pytest.approx(binary_data[3:])
+
+    with open(binary_data_path, 'rb') as f:
+        a = np.empty(3, dtype=np.float32)
+        read_to_ndarray_bulk(a, f)
+        assert a == pytest.approx(binary_data[:3])
+        b = np.empty(3, dtype=np.int32)
+        read_to_ndarray_bulk(b, f)
+        assert b == pytest.approx(binary_data[3:])
+
+    # Non-contiguous destinations are rejected instead of being left
+    # silently unmodified.
+    with open(binary_data_path, 'rb') as f:
+        c = np.empty(6, dtype=np.float32)[::2]
+        with pytest.raises(ValueError):
+            read_to_ndarray_bulk(c, f)
 
 
 def test_flatten_dict():
@@ -98,3 +167,12 @@ def test_flatten_dict():
     assert v['b_c'] == 2
     assert v['b_d'] == 3
     assert v['e'] == 4
+
+
+def test_flatten_dict_compiled():
+
+    u = {'a': 1, 'b': {'c': 2, 'd': 3}, 'e': 4}
+    expected = flatten_dict(u)
+    # Repeated calls on the same layout reuse one generated function.
+    for _ in range(1000):
+        assert flatten_dict_compiled(u) == expected